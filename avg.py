@@ -1,12 +1,10 @@
-import pandas as pd
-import glob
+import os
 
-for csv in glob.glob("./measurements/nrf/*.csv"):
-    df = pd.read_csv(csv)
-    avg = df["time (s)"].mean()
-    print(csv, avg*1000)
+import schema
+from results import PLATFORMS, load_platform
 
-for csv in glob.glob("./measurements/stm/*.csv"):
-    df = pd.read_csv(csv)
-    avg = df["time (s)"].mean()
-    print(csv, avg*1000)
+for platform in PLATFORMS:
+    for op, impls in load_platform(platform).items():
+        for impl, df in impls.items():
+            values, label = schema.convert(df["time (s)"], "time (s)", "ms")
+            print(os.path.join("measurements", platform, f"{op}-{impl}.csv"), f"{label}: {values.mean()}")
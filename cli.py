@@ -0,0 +1,235 @@
+"""Entry point for the analysis: python cli.py <command> [--platform nrf|stm] ...
+
+Text and JSON commands only load pandas/numpy; matplotlib and scipy are
+imported inside the figure and statistics commands that need them.
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+
+PLATFORMS = ["nrf", "stm"]
+
+# Wall-clock budget for a cold `cli.py summary --json`, interpreter start included
+STARTUP_BUDGET_S = 1.0
+
+# Modules the text/JSON paths must never import
+HEAVY_MODULES = ["matplotlib", "scipy"]
+
+#############################################
+# Helpers
+#############################################
+def platforms(args):
+    return [args.platform] if args.platform else PLATFORMS
+
+
+def emit(rows, as_json):
+    """Print a list of dicts as JSON or as an aligned table."""
+    if as_json:
+        print(json.dumps(rows, indent=2, default=float))
+        return
+    if not rows:
+        return
+    columns = list(rows[0])
+    cells = [[f"{r[c]:.6g}" if isinstance(r[c], float) else str(r[c]) for c in columns] for r in rows]
+    widths = [max(len(c), *(len(row[i]) for row in cells)) for i, c in enumerate(columns)]
+    print("  ".join(c.rjust(w) for c, w in zip(columns, widths)))
+    for row in cells:
+        print("  ".join(v.rjust(w) for v, w in zip(row, widths)))
+
+#############################################
+# Text / JSON commands
+#############################################
+def cmd_summary(args):
+    import drift
+    import schema
+    from results import load_platform, mean_and_ci
+
+    display = [("time (s)", "ms"), ("Avg Current (A)", "mA"), ("Avg Power (W)", "mW")]
+    rows = []
+    for platform in platforms(args):
+        drifting = drift.flags(platform)
+        for op, impls in load_platform(platform).items():
+            for impl, df in impls.items():
+                row = {"platform": platform, "op": op, "impl": impl, "n": len(df)}
+                for column, unit in display:
+                    values, label = schema.convert(df[column], column, unit)
+                    mean, ci = mean_and_ci(values)
+                    row[label] = float(mean)
+                    row[f"ci {label}"] = float(ci)
+                # Metrics whose mean hides a trend over the run
+                row["drift"] = ",".join(drifting.get((op, impl), [])) or "-"
+                rows.append(row)
+    emit(rows, args.json)
+
+
+def cmd_plan(args):
+    from planner import plan
+
+    rows = []
+    for platform in platforms(args):
+        df = plan(platform, args.rel_width, args.rel_effect)
+        df.insert(0, "platform", platform)
+        rows.extend(df.to_dict("records"))
+    emit(rows, args.json)
+
+
+def cmd_pareto(args):
+    from pareto import pareto, plot_pareto
+
+    columns = ["platform", "op", "impl", "time (s)", "energy (J)", "edp (J*s)",
+               "flash (bytes)", "dominated"]
+    rows = []
+    for platform in platforms(args):
+        df = pareto(platform)
+        rows.extend(df[columns].to_dict("records"))
+        if args.plot:
+            plot_pareto(df, platform)
+    emit(rows, args.json)
+
+def cmd_drift(args):
+    from drift import analyze, plot_drift
+    from results import load_platform
+
+    rows = []
+    for platform in platforms(args):
+        df = analyze(platform)
+        if not args.all:
+            df = df[df["drift"]]
+        rows.extend(df.to_dict("records"))
+        if args.plot:
+            for op, impls in load_platform(platform).items():
+                for impl, data in impls.items():
+                    plot_drift(data, platform, op, impl)
+    emit(rows, args.json)
+
+#############################################
+# Statistics and figures (heavy imports)
+#############################################
+def cmd_stats(args):
+    from scipy import stats
+
+    from results import IMPL_MAP, load_platform
+
+    rows = []
+    for platform in platforms(args):
+        for op, impls in load_platform(platform).items():
+            hw = next(df for impl, df in impls.items() if IMPL_MAP[impl] == "HW")
+            sw = next(df for impl, df in impls.items() if IMPL_MAP[impl] == "SW")
+            for column in ["time (s)", "Avg Power (W)"]:
+                # Welch's t-test: HW and SW runs have very different variances
+                t, p = stats.ttest_ind(hw[column], sw[column], equal_var=False)
+                rows.append({"platform": platform, "op": op, "metric": column,
+                             "t": float(t), "p": float(p)})
+    emit(rows, args.json)
+
+
+def cmd_figures(args):
+    import plot
+    import plot_flash_usage
+    import plot_v2
+    from drift import plot_drift
+    from pareto import pareto, plot_pareto
+    from results import load_platform
+
+    for platform in platforms(args):
+        plot.main(platform)
+        plot_v2.main(platform)
+        plot_pareto(pareto(platform), platform)
+        for op, impls in load_platform(platform).items():
+            for impl, df in impls.items():
+                plot_drift(df, platform, op, impl)
+    plot_flash_usage.main()
+
+#############################################
+# Startup budget
+#############################################
+def startup_probe(runs=3, cwd=None):
+    """Best wall time of cold `summary --json` runs, and the heavy modules they imported.
+
+    cwd is the folder holding measurements/ (default: the repo root); summary
+    writes the .npz copies there.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    probe = (
+        f"import sys; sys.path.insert(0, {here!r})\n"
+        "import io, contextlib, cli\n"
+        "with contextlib.redirect_stdout(io.StringIO()):\n"
+        "    cli.main(['summary', '--json'])\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        out = subprocess.run([sys.executable, "-c", probe], cwd=cwd or here,
+                             capture_output=True, text=True, check=True).stdout
+        timings.append(time.perf_counter() - start)
+    heavy = [m for m in out.strip().split(",") if m]
+    return min(timings), heavy
+
+
+def cmd_startup(args):
+    """Time cold `summary --json` runs; exit non-zero over budget or on heavy imports."""
+    best, heavy = startup_probe(args.runs)
+    heavy = ",".join(heavy)
+    print(f"summary --json: best {best:.3f} s of {args.runs} runs (budget {args.budget:.3f} s)")
+    if heavy:
+        print(f"FAIL: summary imported {heavy}")
+        return 1
+    if best > args.budget:
+        print("FAIL: over startup budget")
+        return 1
+    print("OK")
+    return 0
+
+#############################################
+# Argument parsing
+#############################################
+def parser():
+    p = argparse.ArgumentParser(description="Embedded crypto measurement analysis")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    def command(name, func, help):
+        c = sub.add_parser(name, help=help)
+        c.add_argument("--platform", choices=PLATFORMS, help="default: all platforms")
+        c.set_defaults(func=func)
+        return c
+
+    c = command("summary", cmd_summary, "mean and 95%% CI per op/impl")
+    c.add_argument("--json", action="store_true")
+
+    c = command("plan", cmd_plan, "iterations needed per op/impl")
+    c.add_argument("--rel-width", type=float, default=0.01)
+    c.add_argument("--rel-effect", type=float, default=0.05)
+    c.add_argument("--json", action="store_true")
+
+    c = command("pareto", cmd_pareto, "time/energy/flash Pareto front")
+    c.add_argument("--plot", action="store_true", help="also save plots/<platform>/pareto.png")
+    c.add_argument("--json", action="store_true")
+
+    c = command("drift", cmd_drift, "trend and change point over iterations")
+    c.add_argument("--all", action="store_true", help="also list series without drift")
+    c.add_argument("--plot", action="store_true", help="also save plots/<platform>/drift/*.png")
+    c.add_argument("--json", action="store_true")
+
+    c = command("stats", cmd_stats, "Welch's t-test HW vs SW (needs scipy)")
+    c.add_argument("--json", action="store_true")
+
+    command("figures", cmd_figures, "regenerate all figures (needs matplotlib)")
+
+    c = sub.add_parser("startup", help="check the summary startup budget")
+    c.add_argument("--budget", type=float, default=STARTUP_BUDGET_S)
+    c.add_argument("--runs", type=int, default=3)
+    c.set_defaults(func=cmd_startup)
+    return p
+
+
+def main(argv=None):
+    args = parser().parse_args(argv)
+    return args.func(args) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
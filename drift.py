@@ -0,0 +1,184 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from figures import pyplot
+from planner import resolution_limited
+from results import PLATFORMS, load_platform, t_quantile
+from traces import TIME_RESOLUTION_S
+
+METRICS = ["time (s)", "Avg Current (A)", "Avg Power (W)"]
+
+# A drift or mean shift is only reported when it is both significant and larger
+# than this fraction of the mean
+MIN_REL_DRIFT = 0.01
+
+# The change point is the best of n - 3 splits, so its z is compared with the
+# same maximum over shuffled copies of the series (a permutation test)
+CHANGE_POINT_ALPHA = 0.05
+CHANGE_POINT_PERMUTATIONS = 999
+
+#############################################
+# Rolling statistics over iteration index
+#############################################
+def rolling(values, window=5):
+    """Rolling mean and std (ddof=1) of each full window, aligned to its last iteration."""
+    values = np.asarray(values, dtype=float)
+    if len(values) < window:
+        return np.array([]), np.array([])
+    c1 = np.concatenate([[0.0], np.cumsum(values)])
+    c2 = np.concatenate([[0.0], np.cumsum(values ** 2)])
+    s1 = c1[window:] - c1[:-window]
+    s2 = c2[window:] - c2[:-window]
+    mean = s1 / window
+    var = np.maximum(s2 - s1 * mean, 0) / (window - 1)
+    return mean, np.sqrt(var)
+
+#############################################
+# Linear drift with 95% CI
+#############################################
+def linear_drift(values):
+    """Least-squares slope per iteration, its 95% CI half-width and drift over the run relative to the mean."""
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    if n < 3:
+        return np.nan, np.nan, np.nan
+    x = np.arange(n) - (n - 1) / 2
+    slope = (x * (y - y.mean())).sum() / (x ** 2).sum()
+    residuals = y - y.mean() - slope * x
+    se = np.sqrt((residuals ** 2).sum() / (n - 2) / (x ** 2).sum())
+    return slope, t_quantile(0.975, n - 2) * se, slope * (n - 1) / y.mean()
+
+#############################################
+# Single change point in the mean
+#############################################
+def best_split(y):
+    """Per row of y: split index minimising within-segment SSE, the standardised
+    shift of the means there and the absolute shift."""
+    n = y.shape[-1]
+    k = np.arange(2, n - 1)  # both segments get at least two iterations
+    c1 = np.cumsum(y, axis=-1)
+    c2 = np.cumsum(y ** 2, axis=-1)
+    left_mean = c1[..., k - 1] / k
+    right_mean = (c1[..., -1:] - c1[..., k - 1]) / (n - k)
+    sse = (c2[..., k - 1] - k * left_mean ** 2) + (c2[..., -1:] - c2[..., k - 1] - (n - k) * right_mean ** 2)
+    best = np.argmin(sse, axis=-1)[..., None]
+    sigma = np.sqrt(np.maximum(np.take_along_axis(sse, best, -1), 0) / (n - 2))[..., 0]
+    shift = np.abs(np.take_along_axis(right_mean - left_mean, best, -1))[..., 0]
+    kb = k[best[..., 0]]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        z = np.where(sigma > 0, shift / (sigma * np.sqrt(1 / kb + 1 / (n - kb))),
+                     np.where(shift > 0, np.inf, 0.0))
+    return kb, z, shift
+
+
+def change_point(values, permutations=CHANGE_POINT_PERMUTATIONS, seed=0):
+    """Best split index, its standardised shift, that shift relative to the
+    overall mean and the permutation p-value of the shift over all splits."""
+    y = np.asarray(values, dtype=float)
+    n = len(y)
+    if n < 4:
+        return None, np.nan, np.nan, np.nan
+    k, z, shift = best_split(y)
+    # Under no change every order of the iterations is equally likely
+    shuffled = np.random.default_rng(seed).permuted(np.tile(y, (permutations, 1)), axis=1)
+    _, z_null, _ = best_split(shuffled)
+    p = (1 + np.count_nonzero(z_null >= z)) / (1 + permutations)
+    return int(k), float(z), shift / abs(y.mean()), p
+
+#############################################
+# Trend analysis per op/impl/metric
+#############################################
+def analyze_series(values, period=None):
+    """Trend and change point of one series.
+
+    Pass period for durations: a resolution-limited series (see
+    planner.resolution_limited) is reported as such and never as drifting.
+    """
+    slope, ci, rel = linear_drift(values)
+    k, z, rel_shift, p = change_point(values)
+    limited = period is not None and resolution_limited(values, period)
+    trending = abs(slope) > ci and abs(rel) > MIN_REL_DRIFT
+    shifted = p < CHANGE_POINT_ALPHA and rel_shift > MIN_REL_DRIFT
+    return {
+        "n": len(values),
+        "slope": slope,
+        "slope ci": ci,
+        "rel drift": rel,
+        "change point": k,
+        "shift z": z,
+        "shift p": p,
+        "rel shift": rel_shift,
+        "shifted": bool(shifted and not limited),
+        "resolution limited": limited,
+        "drift": bool((trending or shifted) and not limited),
+    }
+
+
+def analyze(platform):
+    rows = []
+    for op, impls in load_platform(platform).items():
+        for impl, df in impls.items():
+            for metric in METRICS:
+                row = {"platform": platform, "op": op, "impl": impl, "metric": metric}
+                period = TIME_RESOLUTION_S if metric == "time (s)" else None
+                row.update(analyze_series(df[metric].to_numpy(), period))
+                rows.append(row)
+    return pd.DataFrame(rows)
+
+
+def flags(platform):
+    """{(op, impl): [metrics that drift]} for a platform."""
+    df = analyze(platform)
+    drifting = df[df["drift"]]
+    return {key: list(group["metric"]) for key, group in drifting.groupby(["op", "impl"])}
+
+#############################################
+# Plotting: time series per experiment
+#############################################
+def plot_drift(df, platform, op, impl, window=5):
+    """Each metric over iteration index with rolling mean, linear fit and change point."""
+    plt = pyplot()
+    fig, axes = plt.subplots(len(METRICS), 1, figsize=(10, 3.5 * len(METRICS)), sharex=True)
+    fig.suptitle(f"{op} ({impl}) - {platform.upper()}")
+
+    for ax, metric in zip(axes, METRICS):
+        y = df[metric].to_numpy()
+        x = np.arange(len(y))
+        stats = analyze_series(y, TIME_RESOLUTION_S if metric == "time (s)" else None)
+
+        ax.plot(x, y, "o", label="Iteration")
+        mean, std = rolling(y, window)
+        if len(mean):
+            xr = x[window - 1:]
+            ax.plot(xr, mean, label=f"Rolling mean ({window})")
+            ax.fill_between(xr, mean - std, mean + std, alpha=0.2)
+        if not np.isnan(stats["slope"]):
+            fit = y.mean() + stats["slope"] * (x - x.mean())
+            ax.plot(x, fit, "--", label="Linear fit")
+        if stats["shifted"]:
+            ax.axvline(stats["change point"] - 0.5, color="red", label="Change point")
+
+        ax.set_ylabel(metric)
+        status = "resolution limited" if stats["resolution limited"] else "stable"
+        ax.set_title("DRIFT" if stats["drift"] else status, fontsize=14)
+    axes[-1].set_xlabel("Iteration")
+    axes[0].legend(fontsize=10)
+
+    plt.tight_layout(rect=[0, 0, 1, 0.97])
+    os.makedirs(f"plots/{platform}/drift", exist_ok=True)
+    plt.savefig(f"plots/{platform}/drift/{op}-{impl}.png", dpi=150, bbox_inches="tight")
+    plt.close()
+
+
+if __name__ == "__main__":
+    platform = input("Enter platform (nrf/stm): ").strip().lower()
+    if platform not in PLATFORMS:
+        raise ValueError("Invalid platform. Please enter 'nrf' or 'stm'.")
+
+    print(analyze(platform).to_string(index=False))
+    for op, impls in load_platform(platform).items():
+        for impl, df in impls.items():
+            plot_drift(df, platform, op, impl)
+    print(f"Drift figures saved for platform: {platform}")
@@ -0,0 +1,18 @@
+RC_PARAMS = {
+    "axes.titlesize": 20,
+    "axes.labelsize": 18,
+    "xtick.labelsize": 16,
+    "ytick.labelsize": 16,
+    "legend.fontsize": 16,
+    "figure.titlesize": 22
+}
+
+#############################################
+# Helper: import pyplot only when a figure is drawn
+#############################################
+def pyplot():
+    """Return matplotlib.pyplot with the repo's figure style applied."""
+    import matplotlib.pyplot as plt
+
+    plt.rcParams.update(RC_PARAMS)
+    return plt
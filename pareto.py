@@ -0,0 +1,116 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from figures import pyplot
+from results import IMPL_MAP, PLATFORMS, load_flash, load_platform, mean_and_ci
+
+# Operations measured from a binary that covers more than one of them
+OP_BINARY = {
+    "ecdsa-sign": "ecdsa-sign-verify",
+    "ecdsa-verify": "ecdsa-sign-verify",
+}
+
+# Objectives to minimise when comparing implementations of the same op
+OBJECTIVES = ["time (s)", "energy (J)", "flash (bytes)"]
+
+#############################################
+# Join per-op aggregates with flash size
+#############################################
+def aggregate(platform):
+    """One row per (op, impl): mean/CI of time and energy, flash size and EDP."""
+    flash = load_flash(platform).stack()
+
+    rows = []
+    for op, impls in load_platform(platform).items():
+        for impl, df in impls.items():
+            # Energy of a single iteration: average power over the run times its duration
+            energy = df["time (s)"] * df["Avg Power (W)"]
+            time_mean, time_ci = mean_and_ci(df["time (s)"])
+            energy_mean, energy_ci = mean_and_ci(energy)
+            rows.append({
+                "platform": platform,
+                "op": op,
+                "impl": impl,
+                "kind": IMPL_MAP[impl],
+                "time (s)": time_mean,
+                "time ci (s)": time_ci,
+                "energy (J)": energy_mean,
+                "energy ci (J)": energy_ci,
+                "edp (J*s)": (energy * df["time (s)"]).mean(),
+                "flash (bytes)": flash.get((OP_BINARY.get(op, op), impl), np.nan),
+            })
+    return pd.DataFrame(rows)
+
+#############################################
+# Pareto front per op
+#############################################
+def dominated(values):
+    """Boolean mask of rows dominated by another row (all objectives minimised)."""
+    values = np.asarray(values, dtype=float)
+    # a[i, j] is True where row j is no worse than row i on every objective
+    no_worse = (values[None, :, :] <= values[:, None, :]).all(axis=2)
+    better = (values[None, :, :] < values[:, None, :]).any(axis=2)
+    return (no_worse & better).any(axis=1)
+
+
+def pareto(platform):
+    df = aggregate(platform)
+    df["dominated"] = False
+    for op, group in df.groupby("op"):
+        # Missing flash data must not make a configuration look better
+        values = group[OBJECTIVES].fillna(np.inf).to_numpy()
+        df.loc[group.index, "dominated"] = dominated(values)
+    return df.sort_values(["op", "impl"]).reset_index(drop=True)
+
+#############################################
+# Plotting: time vs energy, flash as marker size
+#############################################
+def plot_pareto(df, platform):
+    plt = pyplot()
+    fig, ax = plt.subplots(figsize=(10, 7))
+    colors = plt.rcParams["axes.prop_cycle"].by_key()["color"]
+    markers = {"HW": "o", "SW": "s"}
+    sizes = 300 * df["flash (bytes)"].fillna(0) / df["flash (bytes)"].max()
+
+    for i, (op, group) in enumerate(df.groupby("op")):
+        color = colors[i % len(colors)]
+        for idx, row in group.iterrows():
+            ax.errorbar(row["time (s)"], row["energy (J)"],
+                        xerr=row["time ci (s)"], yerr=row["energy ci (J)"],
+                        fmt="none", ecolor=color, capsize=3)
+            ax.scatter(row["time (s)"], row["energy (J)"], s=sizes[idx],
+                       marker=markers[row["kind"]],
+                       facecolors="none" if row["dominated"] else color,
+                       edgecolors=color, linewidths=2)
+        ax.scatter([], [], color=color, label=op)
+
+    ax.scatter([], [], marker=markers["HW"], color="gray", label="Hardware Accelerated")
+    ax.scatter([], [], marker=markers["SW"], color="gray", label="RustCrypto")
+    ax.scatter([], [], marker="o", facecolors="none", edgecolors="gray", label="Dominated")
+
+    ax.set_xscale("log")
+    ax.set_yscale("log")
+    ax.set_xlabel("Time (s)")
+    ax.set_ylabel("Energy (J)")
+    pretty = {"nrf": "nRF", "stm": "STM"}[platform]
+    ax.set_title(f"Time / Energy / Flash ({pretty})")
+    ax.legend(fontsize=12)
+
+    plt.tight_layout()
+    os.makedirs(f"plots/{platform}", exist_ok=True)
+    plt.savefig(f"plots/{platform}/pareto.png", dpi=300, bbox_inches="tight")
+    plt.close()
+
+
+if __name__ == "__main__":
+    platform = input("Enter platform (nrf/stm): ").strip().lower()
+    if platform not in PLATFORMS:
+        raise ValueError("Invalid platform. Please enter 'nrf' or 'stm'.")
+
+    df = pareto(platform)
+    columns = ["op", "impl", "time (s)", "energy (J)", "edp (J*s)", "flash (bytes)", "dominated"]
+    print(df[columns].to_string(index=False))
+    plot_pareto(df, platform)
+    print(f"Pareto figure saved for platform: {platform}")
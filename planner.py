@@ -0,0 +1,127 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+from results import PLATFORMS, load_platform, t_quantile
+from traces import TIME_RESOLUTION_S
+
+METRICS = ["time (s)", "Avg Power (W)"]
+
+# Never plan fewer iterations than this: the CI of a smaller pilot is not trustworthy
+MIN_ITERATIONS = 5
+
+# Durations are measured between GPI edges, so they are quantised to the logic
+# analyser's sample period (TIME_RESOLUTION_S). Below RESOLUTION_PERIODS periods,
+# or when every iteration lands on the same tick, the spread says nothing about
+# the real variance.
+RESOLUTION_PERIODS = 10
+
+#############################################
+# Helper: smallest n with n >= required(n)
+#############################################
+def smallest_n(required):
+    """Smallest n >= MIN_ITERATIONS that satisfies n >= required(n).
+
+    required(n) uses t quantiles at the dof of n iterations, so it decreases
+    with n; required(math.inf) is the normal approximation and a lower bound.
+    """
+    n = max(MIN_ITERATIONS, math.ceil(required(math.inf)))
+    while n < required(n):
+        n += 1
+    return n
+
+#############################################
+# Ops whose time is limited by the sample period
+#############################################
+def resolution_limited(values, period=TIME_RESOLUTION_S):
+    """True when values are too close to the sampling grid for a CI to mean anything."""
+    values = np.asarray(values, dtype=float)
+    if len(values) == 0:
+        return False
+    ticks = values / period
+    on_one_tick = np.allclose(ticks, np.round(ticks[0]), rtol=0, atol=1e-3)
+    return bool(abs(values.mean()) < RESOLUTION_PERIODS * period or on_one_tick)
+
+#############################################
+# Iterations needed for a target relative CI half-width
+#############################################
+def n_for_ci(values, rel_width=0.01, confidence=0.95):
+    """Iterations so that the CI half-width is at most rel_width * mean."""
+    values = np.asarray(values, dtype=float)
+    mean = values.mean()
+    std = values.std(ddof=1)
+    if std == 0:
+        return MIN_ITERATIONS
+    q = (1 + confidence) / 2
+    return smallest_n(lambda n: (t_quantile(q, n - 1) * std / (rel_width * abs(mean))) ** 2)
+
+#############################################
+# Iterations needed to detect a relative shift of the mean
+#############################################
+def n_for_effect(values, rel_effect=0.05, alpha=0.05, power=0.8):
+    """Iterations per run to detect a change of rel_effect * mean between two runs."""
+    values = np.asarray(values, dtype=float)
+    std = values.std(ddof=1)
+    if std == 0:
+        return MIN_ITERATIONS
+    delta = rel_effect * abs(values.mean())
+    # Two runs of n iterations each: the difference of means has 2n - 2 dof
+    return smallest_n(lambda n: 2 * ((t_quantile(1 - alpha / 2, 2 * n - 2)
+                                       + t_quantile(power, 2 * n - 2)) * std / delta) ** 2)
+
+#############################################
+# Sequential stopping check for the capture loop
+#############################################
+def enough(values, rel_width=0.01, confidence=0.95, max_n=None, period=None):
+    """True once the iterations captured so far reach the target relative CI.
+
+    Meant to be called after each new iteration; stops at max_n regardless.
+    Pass period for durations: a resolution-limited series never counts as enough.
+    """
+    values = np.asarray(values, dtype=float)
+    n = len(values)
+    if max_n is not None and n >= max_n:
+        return True
+    if n < MIN_ITERATIONS:
+        return False
+    if period is not None and resolution_limited(values, period):
+        return False
+    half_width = t_quantile((1 + confidence) / 2, n - 1) * values.std(ddof=1) / np.sqrt(n)
+    return half_width <= rel_width * abs(values.mean())
+
+#############################################
+# Plan every op/impl of a platform from its pilot data
+#############################################
+def plan(platform, rel_width=0.01, rel_effect=0.05):
+    rows = []
+    for op, impls in load_platform(platform).items():
+        for impl, df in impls.items():
+            for metric in METRICS:
+                values = df[metric]
+                period = TIME_RESOLUTION_S if metric == "time (s)" else None
+                limited = period is not None and resolution_limited(values, period)
+                rows.append({
+                    "op": op,
+                    "impl": impl,
+                    "metric": metric,
+                    "pilot n": len(values),
+                    "cv": values.std() / values.mean(),
+                    # More iterations of a resolution-limited op do not narrow its CI
+                    "n for ci": None if limited else n_for_ci(values, rel_width),
+                    "n for effect": None if limited else n_for_effect(values, rel_effect),
+                    "resolution limited": limited,
+                    "enough": enough(values, rel_width, period=period),
+                })
+    return pd.DataFrame(rows)
+
+
+if __name__ == "__main__":
+    platform = input("Enter platform (nrf/stm): ").strip().lower()
+    if platform not in PLATFORMS:
+        raise ValueError("Invalid platform. Please enter 'nrf' or 'stm'.")
+
+    rel_width = float(input("Target relative CI half-width [0.01]: ").strip() or 0.01)
+    rel_effect = float(input("Relative effect size to detect [0.05]: ").strip() or 0.05)
+
+    print(plan(platform, rel_width, rel_effect).to_string(index=False))
@@ -1,16 +1,12 @@
-import matplotlib.pyplot as plt
+import os
+
 import numpy as np
 
-plt.rcParams.update({
-    "axes.titlesize": 20,
-    "axes.labelsize": 18,
-    "xtick.labelsize": 16,
-    "ytick.labelsize": 16,
-    "legend.fontsize": 16,
-    "figure.titlesize": 22
-})
+from figures import pyplot
+from results import IMPL_MAP, load_flash
 
 def plot_flash_comparison(ops, flash_hw, flash_sw, title, output_file):
+    plt = pyplot()
     x = np.arange(len(ops))
     width = 0.35
 
@@ -25,30 +21,32 @@ def plot_flash_comparison(ops, flash_hw, flash_sw, title, output_file):
     plt.legend()
 
     plt.tight_layout()
+    os.makedirs(os.path.dirname(output_file), exist_ok=True)
     plt.savefig(output_file, dpi=300, bbox_inches="tight")
     plt.close()
 
 
 #############################################
-# Data for nrf
-#############################################
-# Data generated using cargo size --release --bin "$BIN" -- -A | awk '/\.text|\.rodata|\.data/ {sum += strtonum($2)} END {print sum}'
-# where $BIN is the binary name
-ops = ["aes-128", "ec-mult", "ecdsa-sign-verify", "sha2-256"]
-cracen_nrf = [7692, 13424, 19652, 8704]
-rustcrypto_nrf = [13368, 31920, 46824, 15276]
-
-#############################################
-# Data for stm
+# Load flash data
 #############################################
-pac_stm = [7928, 8688, 10040, 7536]
-rustcrypto_stm = [13340, 28176, 47044, 15908]
+def flash_by_kind(platform):
+    """Return (binaries, HW flash, SW flash) for a platform."""
+    table = load_flash(platform)
+    hw = [impl for impl in table.columns if IMPL_MAP[impl] == "HW"][0]
+    return list(table.index), list(table[hw]), list(table["rustcrypto"])
 
 #############################################
 # Generate both plots
 #############################################
-plot_flash_comparison(ops, cracen_nrf, rustcrypto_nrf,
-                      "Flash Usage (nRF)", "plots/nrf/flash_usage.png")
+def main():
+    ops, cracen_nrf, rustcrypto_nrf = flash_by_kind("nrf")
+    plot_flash_comparison(ops, cracen_nrf, rustcrypto_nrf,
+                          "Flash Usage (nRF)", "plots/nrf/flash_usage.png")
+
+    ops, pac_stm, rustcrypto_stm = flash_by_kind("stm")
+    plot_flash_comparison(ops, pac_stm, rustcrypto_stm,
+                          "Flash Usage (STM)", "plots/stm/flash_usage.png")
+
 
-plot_flash_comparison(ops, pac_stm, rustcrypto_stm,
-                      "Flash Usage (STM)", "plots/stm/flash_usage.png")
+if __name__ == "__main__":
+    main()
@@ -1,164 +1,105 @@
-import pandas as pd
 import numpy as np
-import glob
 import os
-import matplotlib.pyplot as plt
 
-plt.rcParams.update({
-    "axes.titlesize": 20,
-    "axes.labelsize": 18,
-    "xtick.labelsize": 16,
-    "ytick.labelsize": 16,
-    "legend.fontsize": 16,
-    "figure.titlesize": 22
-})
+from figures import pyplot
+from results import PLATFORMS, load
 
 #############################################
-# Helper: compute mean and 95% CI
+# Metrics to plot
 #############################################
-def mean_and_ci(series):
-    mean = series.mean()
-    std = series.std()
-    n = len(series)
-    ci95 = 1.96 * (std / np.sqrt(n))
-    return mean, ci95
+# Stored (SI) column and the unit it is displayed in
+COLUMN_MAP = {
+    "time_s": ("time (s)", "ms"),
+    "avg_current_A": ("Avg Current (A)", "mA"),
+    "avg_power_W": ("Avg Power (W)", "mW")
+}
 
-#############################################
-# Ask user for platform
-#############################################
-platform = input("Enter platform (nrf/stm): ").strip().lower()
-if platform not in ["nrf", "stm"]:
-    raise ValueError("Invalid platform. Please enter 'nrf' or 'stm'.")
+def main(platform):
+    plt = pyplot()
+    data, results = load(platform, COLUMN_MAP)
+    operations = list(data.keys())
+
+    #############################################
+    # Plotting: Time with two subplots (HW / SW)
+    #############################################
+    hw_ops = [op for op in operations if "HW" in data[op]]
+    sw_ops = [op for op in operations if "SW" in data[op]]
+
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    fig.suptitle(f"Time Comparison - {platform.upper()}")
+
+    # Hardware subplot
+    x = np.arange(len(hw_ops))
+    hw_means = [results["time_s"]["values"][op]["HW"][0] for op in hw_ops]
+    hw_cis = [results["time_s"]["values"][op]["HW"][1] for op in hw_ops]
+    axes[0].bar(x, hw_means, yerr=hw_cis, capsize=5)
+    axes[0].set_xticks(x)
+    axes[0].set_xticklabels([op.upper() for op in hw_ops])
+    axes[0].set_ylabel(results["time_s"]["label"])
+    axes[0].set_title("Hardware")
+    # axes[0].set_yscale("log")
+
+    # Software subplot
+    x = np.arange(len(sw_ops))
+    sw_means = [results["time_s"]["values"][op]["SW"][0] for op in sw_ops]
+    sw_cis = [results["time_s"]["values"][op]["SW"][1] for op in sw_ops]
+    axes[1].bar(x, sw_means, yerr=sw_cis, capsize=5, color = "darkorange")
+    axes[1].set_xticks(x)
+    axes[1].set_xticklabels([op.upper() for op in sw_ops])
+    axes[1].set_ylabel(results["time_s"]["label"])
+    axes[1].set_title("Software")
+    # axes[1].set_yscale("log")
+
+    plt.tight_layout(rect=[0, 0, 1, 0.95])
+    os.makedirs(f"plots/{platform}", exist_ok=True)
+    plt.savefig(f"plots/{platform}/time_hw_vs_sw_separate.png", dpi=300, bbox_inches='tight')
+    plt.close()
 
-folder = os.path.join("measurements", platform)
+    #############################################
+    # Plotting: Current and Power (same as before)
+    #############################################
+    def plot_metric(metric_key):
+        label = results[metric_key]["label"]
+        metric_data = results[metric_key]["values"]
+        metric_data = {k: metric_data[k] for k in sorted(metric_data)}
 
-#############################################
-# Load CSV files
-#############################################
-data = {}
-COLUMN_MAP = {
-    "time_s": "time (s)",
-    "avg_current_A": "Avg Current (A)",
-    "avg_power_W": "Avg Power (W)"
-}
 
-IMPL_MAP = {
-    "cracen": "HW",
-    "pac": "HW",
-    "rustcrypto": "SW"
-}
+        ops = list(metric_data.keys())
+        x = np.arange(len(ops))
+        width = 0.35
 
-for filename in glob.glob(os.path.join(folder, "*.csv")):
-    base = os.path.basename(filename)
-    
-    impl_label = None
-    op_name = None
-    for key, val in IMPL_MAP.items():
-        if key in base:
-            impl_label = val
-            op_name = base.replace(f"-{key}.csv", "")
-            break
-    if impl_label is None:
-        continue  # skip unknown files
-
-    df = pd.read_csv(filename)
-    
-    if op_name not in data:
-        data[op_name] = {}
-    data[op_name][impl_label] = df
-
-operations = list(data.keys())
+        hw_means = [metric_data[op]["HW"][0] for op in ops]
+        hw_errs  = [metric_data[op]["HW"][1] for op in ops]
 
-#############################################
-# Prepare results per metric
-#############################################
-results = {
-    "time_s": {"label": "Time", "values": {}},
-    "avg_current_A": {"label": "Avg Current (mA)", "values": {}},
-    "avg_power_W": {"label": "Avg Power (mW)", "values": {}},
-}
+        sw_means = [metric_data[op]["SW"][0] for op in ops]
+        sw_errs  = [metric_data[op]["SW"][1] for op in ops]
 
-for op in operations:
-    for impl in ["HW", "SW"]:
-        df = data[op][impl]
-        for key in results:
-            mean, ci = mean_and_ci(df[COLUMN_MAP[key]])
-            results[key]["values"].setdefault(op, {})[impl] = (mean, ci)
+        fig, ax = plt.subplots(figsize=(10, 5))
 
-#############################################
-# Plotting: Time with two subplots (HW / SW)
-#############################################
-hw_ops = [op for op in operations if "HW" in data[op]]
-sw_ops = [op for op in operations if "SW" in data[op]]
-
-fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-fig.suptitle(f"Time Comparison - {platform.upper()}")
-
-# Hardware subplot
-x = np.arange(len(hw_ops))
-hw_means = [results["time_s"]["values"][op]["HW"][0] * 1000 for op in hw_ops]
-hw_cis = [results["time_s"]["values"][op]["HW"][1] * 1000 for op in hw_ops]
-axes[0].bar(x, hw_means, yerr=hw_cis, capsize=5)
-axes[0].set_xticks(x)
-axes[0].set_xticklabels([op.upper() for op in hw_ops])
-axes[0].set_ylabel("Time (ms)")
-axes[0].set_title("Hardware")
-# axes[0].set_yscale("log")
-
-# Software subplot
-x = np.arange(len(sw_ops))
-sw_means = [results["time_s"]["values"][op]["SW"][0] * 1000 for op in sw_ops]
-sw_cis = [results["time_s"]["values"][op]["SW"][1] * 1000 for op in sw_ops]
-axes[1].bar(x, sw_means, yerr=sw_cis, capsize=5, color = "darkorange")
-axes[1].set_xticks(x)
-axes[1].set_xticklabels([op.upper() for op in sw_ops])
-axes[1].set_ylabel("Time (ms)")
-axes[1].set_title("Software")
-# axes[1].set_yscale("log")
-
-plt.tight_layout(rect=[0, 0, 1, 0.95])
-os.makedirs(f"plots/{platform}", exist_ok=True)
-plt.savefig(f"plots/{platform}/time_hw_vs_sw_separate.png", dpi=300, bbox_inches='tight')
-plt.close()
+        ax.bar(x - width/2, hw_means, width, yerr=hw_errs, capsize=5, label="Hardware Accelerated")
+        ax.bar(x + width/2, sw_means, width, yerr=sw_errs, capsize=5, label="RustCrypto")
 
-#############################################
-# Plotting: Current and Power (same as before)
-#############################################
-def plot_metric(metric_key):
-    label = results[metric_key]["label"]
-    metric_data = results[metric_key]["values"]
-    metric_data = {k: metric_data[k] for k in sorted(metric_data)}
-
-    
-    ops = list(metric_data.keys())
-    x = np.arange(len(ops))
-    width = 0.35
-    
-    hw_means = [metric_data[op]["HW"][0] * 1000 for op in ops]
-    hw_errs  = [metric_data[op]["HW"][1] * 1000 for op in ops]
-    
-    sw_means = [metric_data[op]["SW"][0] * 1000 for op in ops]
-    sw_errs  = [metric_data[op]["SW"][1] * 1000 for op in ops]
-
-    fig, ax = plt.subplots(figsize=(10, 5))
-    
-    ax.bar(x - width/2, hw_means, width, yerr=hw_errs, capsize=5, label="Hardware Accelerated")
-    ax.bar(x + width/2, sw_means, width, yerr=sw_errs, capsize=5, label="RustCrypto")
-    
-    ax.set_ylabel(label)
-    ax.set_xticks(x)
-    ax.set_xticklabels(ops)
-    pretty = lambda p: {"nrf": "nRF", "stm": "STM"}.get(p.lower(), p)
-    ax.set_title(f"{label}: RustCrypto vs Hardware Accelerated ({pretty(platform)})")
-    ax.legend()
-    
-    plt.tight_layout()
-    os.makedirs(f"plots/{platform}", exist_ok=True)
-    plt.savefig(f"plots/{platform}/{metric_key}_comparison.png", dpi=300, bbox_inches='tight')
-    plt.close()
+        ax.set_ylabel(label)
+        ax.set_xticks(x)
+        ax.set_xticklabels(ops)
+        pretty = lambda p: {"nrf": "nRF", "stm": "STM"}.get(p.lower(), p)
+        ax.set_title(f"{label}: RustCrypto vs Hardware Accelerated ({pretty(platform)})")
+        ax.legend()
+
+        plt.tight_layout()
+        os.makedirs(f"plots/{platform}", exist_ok=True)
+        plt.savefig(f"plots/{platform}/{metric_key}_comparison.png", dpi=300, bbox_inches='tight')
+        plt.close()
+
+    plot_metric("avg_current_A")
+    plot_metric("avg_power_W")
+    plot_metric("time_s")
+
+    print(f"All figures saved for platform: {platform}")
 
-plot_metric("avg_current_A")
-plot_metric("avg_power_W")
-plot_metric("time_s")
 
-print(f"All figures saved for platform: {platform}")
+if __name__ == "__main__":
+    platform = input("Enter platform (nrf/stm): ").strip().lower()
+    if platform not in PLATFORMS:
+        raise ValueError("Invalid platform. Please enter 'nrf' or 'stm'.")
+    main(platform)
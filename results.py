@@ -0,0 +1,114 @@
+import glob
+import os
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+import schema
+
+PLATFORMS = ["nrf", "stm"]
+
+# Data generated using cargo size --release --bin "$BIN" -- -A | awk '/\.text|\.rodata|\.data/ {sum += strtonum($2)} END {print sum}'
+# where $BIN is the binary name
+FLASH_CSV = "measurements/flash_usage.csv"
+
+# Map file identifiers to implementation type
+IMPL_MAP = {
+    "cracen": "HW",
+    "pac": "HW",
+    "rustcrypto": "SW"
+}
+
+#############################################
+# Helper: compute mean and 95% CI
+#############################################
+def mean_and_ci(series):
+    mean = series.mean()
+    std = series.std()
+    n = len(series)
+    ci95 = 1.96 * (std / np.sqrt(n))
+    return mean, ci95
+
+#############################################
+# Helper: Student t quantile without scipy
+#############################################
+# Exact 97.5% quantiles where the expansion below is poor
+T_975 = {1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776}
+
+
+def t_quantile(p, dof):
+    """Cornish-Fisher expansion of the t quantile; within 0.1% of the exact value for dof >= 5."""
+    if p == 0.975 and dof in T_975:
+        return T_975[dof]
+    z = NormalDist().inv_cdf(p)
+    return (z
+            + (z ** 3 + z) / (4 * dof)
+            + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * dof ** 2)
+            + (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / (384 * dof ** 3)
+            + (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z)
+            / (92160 * dof ** 4))
+
+#############################################
+# Load measurements/<platform>/<op>-<impl>.csv
+#############################################
+def split_name(filename):
+    """Return (op, impl) for a measurement file, or None if the impl is unknown."""
+    base = os.path.basename(filename)
+    stem, _ = os.path.splitext(base)
+    for impl in IMPL_MAP:
+        if stem.endswith(f"-{impl}"):
+            return stem[:-len(impl) - 1], impl
+    return None
+
+
+def load_platform(platform, folder="measurements"):
+    """Return {op: {impl: DataFrame}} for every known file of a platform."""
+    if platform not in PLATFORMS:
+        raise ValueError(f"Invalid platform {platform!r}. Expected one of {PLATFORMS}.")
+
+    data = {}
+    for filename in sorted(glob.glob(os.path.join(folder, platform, "*.csv"))):
+        name = split_name(filename)
+        if name is None:
+            continue  # skip unknown files
+        op, impl = name
+        data.setdefault(op, {})[impl] = schema.read(filename)
+    return data
+
+
+#############################################
+# Mean and CI per op, HW vs SW, for figures
+#############################################
+def load(platform, column_map, folder="measurements"):
+    """Return ({op: {"HW"|"SW": df}}, results) for a platform.
+
+    column_map maps a result key to (stored SI column, display unit), e.g.
+    {"time_ms": ("time (s)", "ms")}; results[key] holds the axis label from
+    schema.convert and {op: {"HW"|"SW": (mean, ci)}} in that unit.
+    """
+    data = {}
+    for op, impls in load_platform(platform, folder).items():
+        for impl, df in impls.items():
+            data.setdefault(op, {})[IMPL_MAP[impl]] = df
+
+    results = {key: {"label": None, "values": {}} for key in column_map}
+    for op in data:
+        for impl in ["HW", "SW"]:
+            df = data[op][impl]
+            for key, (column, unit) in column_map.items():
+                values, results[key]["label"] = schema.convert(df[column], column, unit)
+                results[key]["values"].setdefault(op, {})[impl] = mean_and_ci(values)
+    return data, results
+
+#############################################
+# Load flash usage per binary
+#############################################
+def load_flash(platform, path=FLASH_CSV):
+    """Return a DataFrame of flash (bytes) with one row per binary and one column per impl."""
+    if platform not in PLATFORMS:
+        raise ValueError(f"Invalid platform {platform!r}. Expected one of {PLATFORMS}.")
+
+    df = pd.read_csv(path)
+    df = df[df["platform"] == platform]
+    return df.pivot(index="binary", columns="impl", values="flash (bytes)")
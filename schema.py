@@ -0,0 +1,123 @@
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+#############################################
+# Declared schema of measurements/<platform>/<op>-<impl>.csv
+#############################################
+# Column name, SI unit, dtype. Values are always stored in the SI unit;
+# other scales are only produced for display by convert().
+SCHEMA = [
+    ("time (s)", "s", "float64"),
+    ("Avg Current (A)", "A", "float64"),
+    ("Min Current (A)", "A", "float64"),
+    ("Max Current (A)", "A", "float64"),
+    ("Avg Power (W)", "W", "float64"),
+    ("Min Power (W)", "W", "float64"),
+    ("Max Power (W)", "W", "float64"),
+]
+
+COLUMNS = [name for name, _, _ in SCHEMA]
+UNITS = {name: unit for name, unit, _ in SCHEMA}
+DTYPES = {name: dtype for name, _, dtype in SCHEMA}
+
+PREFIXES = {"": 1.0, "m": 1e-3, "u": 1e-6, "µ": 1e-6, "n": 1e-9}
+
+#############################################
+# Validation
+#############################################
+def validate(df):
+    """Return df with the declared columns, in order and dtype; raise ValueError otherwise."""
+    df = df.rename(columns=str.strip)
+    missing = [c for c in COLUMNS if c not in df.columns]
+    extra = [c for c in df.columns if c not in COLUMNS]
+    if missing or extra:
+        raise ValueError(f"Columns do not match schema: missing {missing}, unexpected {extra}")
+
+    df = df[COLUMNS].astype(DTYPES)
+    if df.isna().any().any():
+        raise ValueError("Measurements contain missing values")
+    if (df["time (s)"] <= 0).any():
+        raise ValueError("time (s) must be positive")
+    for quantity, unit in [("Current", "A"), ("Power", "W")]:
+        lo, avg, hi = (df[f"{kind} {quantity} ({unit})"] for kind in ["Min", "Avg", "Max"])
+        if not ((lo <= avg) & (avg <= hi)).all():
+            raise ValueError(f"Expected Min <= Avg <= Max {quantity} ({unit}) in every row")
+    return df
+
+#############################################
+# Read / write: CSV plus a compact binary copy (.npz)
+#############################################
+def binary_path(path):
+    return os.path.splitext(path)[0] + ".npz"
+
+
+def write_binary(df, path):
+    """Write the .npz copy through a temp file, so readers never see a partial one."""
+    target = binary_path(path)
+    fd, tmp = tempfile.mkstemp(suffix=".npz.tmp", dir=os.path.dirname(target) or ".")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez(f, **{name: df[name].to_numpy() for name in COLUMNS})
+        os.replace(tmp, target)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def read_binary(npz):
+    """Validated DataFrame from an .npz copy, or None if it cannot be loaded."""
+    try:
+        with np.load(npz) as arrays:
+            return validate(pd.DataFrame({name: arrays[name] for name in arrays.files}))
+    except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+        return None  # damaged or stale copy: the caller falls back to the CSV
+
+
+def write(df, path):
+    """Validate and write df as CSV and as .npz next to it."""
+    df = validate(pd.DataFrame(df))
+    df.to_csv(path, index=False, float_format="%.12g")
+    write_binary(df, path)
+
+
+def read(path, cache=True):
+    """Read a measurement file, preferring an up-to-date .npz copy of the CSV.
+
+    Side effect: with cache=True a missing, stale or unreadable .npz is
+    (re)written next to the CSV, so reading measurements/ writes into it.
+    Pass cache=False to leave the folder untouched.
+    """
+    npz = binary_path(path)
+    if os.path.exists(npz) and (not os.path.exists(path)
+                                or os.path.getmtime(npz) >= os.path.getmtime(path)):
+        df = read_binary(npz)
+        if df is not None:
+            return df
+
+    df = validate(pd.read_csv(path, skipinitialspace=True))
+    if cache:
+        try:
+            write_binary(df, path)
+        except OSError:
+            pass  # read-only checkout: keep working from the CSV
+    return df
+
+#############################################
+# Unit conversion for display
+#############################################
+def convert(values, column, unit):
+    """Return (values expressed in unit, axis label), e.g. convert(df["time (s)"], "time (s)", "ms")."""
+    base = UNITS[column]
+    prefix = unit[:-len(base)] if unit.endswith(base) else None
+    if prefix not in PREFIXES:
+        raise ValueError(f"Cannot express {column} in {unit}")
+    return values / PREFIXES[prefix], display_label(column, unit)
+
+
+def display_label(column, unit):
+    """Axis label of column shown in unit, e.g. "Avg Current (mA)"."""
+    return column.replace(f"({UNITS[column]})", f"({unit})")
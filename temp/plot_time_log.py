@@ -1,57 +1,65 @@
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import glob
 import os
-from scipy import stats
+import sys
 
-# --- CONFIG ---
-platform = input("Enter platform (nrf/stm): ").strip().lower()
-if platform not in ["nrf", "stm"]:
-    raise ValueError("Invalid platform. Enter 'nrf' or 'stm'.")
+import numpy as np
+
+# The analysis modules live at the repository root, one level up
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import schema
+from figures import pyplot
+from results import IMPL_MAP, PLATFORMS, load_platform, t_quantile
 
-data_folder = os.path.join("./measurements", platform)   # platform-specific folder
-output_folder = "./figs"
-os.makedirs(output_folder, exist_ok=True)
+# --- CONFIG ---
+output_folder = os.path.join(ROOT, "temp", "figs")
 
 # --- HELPER FUNCTION ---
 def mean_and_ci(series, confidence=0.95):
-    data = series.values
-    n = len(data)
-    mean = np.mean(data)
-    se = stats.sem(data)
-    h = se * stats.t.ppf((1 + confidence) / 2., n-1)
+    n = len(series)
+    mean = series.mean()
+    h = t_quantile((1 + confidence) / 2, n - 1) * series.std() / np.sqrt(n)
     return mean, h
 
-# --- LOAD FILES ---
-hw_files = glob.glob(os.path.join(data_folder, "*cracen*.csv"))
-sw_files = glob.glob(os.path.join(data_folder, "*rustcrypto*.csv"))
-
 # --- PLOTTING FUNCTION ---
-def plot_time(files, title, filename):
+def plot_time(data, title, filename):
+    plt = pyplot()
     ops = []
     means = []
     cis = []
 
-    for f in files:
-        df = pd.read_csv(f)
-        mean, ci = mean_and_ci(df['time (ms)'])  # keep in ms
-        op_name = os.path.basename(f).split('-')[0]  # use filename to label operation
-        ops.append(op_name)
+    for op, df in data.items():
+        values, label = schema.convert(df["time (s)"], "time (s)", "ms")
+        mean, ci = mean_and_ci(values)
+        ops.append(op)
         means.append(mean)
         cis.append(ci)
 
     plt.figure(figsize=(8,5))
     plt.bar(ops, means, yerr=cis, capsize=5, color='skyblue')
     plt.yscale('log')
-    plt.ylabel("Time (ms, log scale)")
+    plt.ylabel(f"{label[:-1]}, log scale)")
     plt.title(title)
     plt.tight_layout()
     plt.savefig(os.path.join(output_folder, filename), dpi=300)
     plt.close()
 
 # --- GENERATE PLOTS ---
-plot_time(hw_files, f"{platform.upper()} Hardware Time", f"{platform}_hw_time.png")
-plot_time(sw_files, f"{platform.upper()} Software Time", f"{platform}_sw_time.png")
+def main(platform):
+    os.makedirs(output_folder, exist_ok=True)
+    hw, sw = {}, {}
+    for op, impls in load_platform(platform, os.path.join(ROOT, "measurements")).items():
+        for impl, df in impls.items():
+            (hw if IMPL_MAP[impl] == "HW" else sw)[op] = df
+
+    plot_time(hw, f"{platform.upper()} Hardware Time", f"{platform}_hw_time.png")
+    plot_time(sw, f"{platform.upper()} Software Time", f"{platform}_sw_time.png")
+
+    print("Plots saved in:", output_folder)
+
 
-print("Plots saved in:", output_folder)
+if __name__ == "__main__":
+    platform = input("Enter platform (nrf/stm): ").strip().lower()
+    if platform not in PLATFORMS:
+        raise ValueError("Invalid platform. Enter 'nrf' or 'stm'.")
+    main(platform)
@@ -1,98 +1,83 @@
-import pandas as pd
-import numpy as np
-import glob
 import os
-import matplotlib.pyplot as plt
-
-#############################################
-# Helper: compute mean and 95% CI
-#############################################
-def mean_and_ci(series):
-    mean = series.mean()
-    std = series.std()
-    n = len(series)
-    ci95 = 1.96 * (std / np.sqrt(n))
-    return mean, ci95
-
-#############################################
-# Ask user for platform
-#############################################
-platform = input("Enter platform (nrf/stm): ").strip().lower()
-if platform not in ["nrf", "stm"]:
-    raise ValueError("Invalid platform. Please enter 'nrf' or 'stm'.")
-
-folder = os.path.join("measurements", platform)
-
-#############################################
-# Load CSV files
-#############################################
-data = {}
-for filename in glob.glob(os.path.join(folder, "*.csv")):
-    base = os.path.basename(filename)
+import sys
 
-    if "cracen" in base or "pac" in base:
-        impl = "HW"
-    elif "rustcrypto" in base:
-        impl = "SW"
-    else:
-        continue
+import numpy as np
 
-    op = base.replace("-cracen.csv", "").replace("-pac.csv", "").replace("-rustcrypto.csv", "")
+# The analysis modules live at the repository root, one level up
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
 
-    df = pd.read_csv(filename)
-    if op not in data:
-        data[op] = {}
-    data[op][impl] = df
+import schema
+from figures import pyplot
+from results import IMPL_MAP, PLATFORMS, load_platform, mean_and_ci
 
 #############################################
 # Define groups
 #############################################
-group1 = ["aes-256", "sha-256"]            # symmetric
-group2 = ["ecdsa", "ecc_scalar_mult"]      # asymmetric
+group1 = ["aes-128", "sha2-256"]                          # symmetric
+group2 = ["ecdsa-sign", "ecdsa-verify", "ec-mult"]        # asymmetric
 groups = [group1, group2]
 titles = ["Symmetric operations", "Asymmetric operations"]
 
 #############################################
 # Plot figure with 2 subplots
 #############################################
-fig, axes = plt.subplots(1, 2, figsize=(14, 5))
-fig.suptitle(f"Time Comparison - {platform.upper()}")
-
-for ax, group, subtitle in zip(axes, groups, titles):
-    ops = []
-    hw_means, hw_cis = [], []
-    sw_means, sw_cis = [], []
-
-    for op in group:
-        if op not in data:
-            print(f"Warning: {op} not found in {platform} measurements.")
-            continue
-        ops.append(op.upper())
-
-        # Hardware in ms
-        hw_mean, hw_ci = mean_and_ci(data[op]["HW"]["time (ms)"])
-        hw_means.append(hw_mean)
-        hw_cis.append(hw_ci)
-
-        # Software in seconds
-        sw_mean, sw_ci = mean_and_ci(data[op]["SW"]["time (ms)"]) / 1000.0
-        sw_cis.append(sw_ci / 1000.0)
-        sw_means.append(sw_mean)
-
-    x = np.arange(len(ops))
-    width = 0.35
-    ax.bar(x - width/2, hw_means, width, yerr=hw_cis, capsize=5, label="Hardware (ms)")
-    ax.bar(x + width/2, sw_means, width, yerr=sw_cis, capsize=5, label="Software (s)")
-    ax.set_xticks(x)
-    ax.set_xticklabels(ops)
-    ax.set_ylabel("Time")
-    ax.set_title(subtitle)
-    ax.legend()
-    # ax.set_yscale("log")  # keep log scale
-
-plt.tight_layout(rect=[0, 0, 1, 0.95])
-os.makedirs(f"plots/{platform}", exist_ok=True)
-plt.savefig(f"plots/{platform}/time_hw_vs_sw_split.png", dpi=300, bbox_inches='tight')
-plt.close()
-
-print(f"Figure saved for platform: {platform}")
+def main(platform):
+    plt = pyplot()
+
+    data = {}
+    for op, impls in load_platform(platform, os.path.join(ROOT, "measurements")).items():
+        for impl, df in impls.items():
+            data.setdefault(op, {})[IMPL_MAP[impl]] = df
+
+    fig, axes = plt.subplots(1, 2, figsize=(14, 5))
+    fig.suptitle(f"Time Comparison - {platform.upper()}")
+
+    for ax, group, subtitle in zip(axes, groups, titles):
+        ops = []
+        hw_means, hw_cis = [], []
+        sw_means, sw_cis = [], []
+
+        for op in group:
+            if op not in data:
+                print(f"Warning: {op} not found in {platform} measurements.")
+                continue
+            ops.append(op.upper())
+
+            # Hardware in ms
+            values, hw_label = schema.convert(data[op]["HW"]["time (s)"], "time (s)", "ms")
+            hw_mean, hw_ci = mean_and_ci(values)
+            hw_means.append(hw_mean)
+            hw_cis.append(hw_ci)
+
+            # Software in seconds
+            values, sw_label = schema.convert(data[op]["SW"]["time (s)"], "time (s)", "s")
+            sw_mean, sw_ci = mean_and_ci(values)
+            sw_means.append(sw_mean)
+            sw_cis.append(sw_ci)
+
+        x = np.arange(len(ops))
+        width = 0.35
+        ax.bar(x - width/2, hw_means, width, yerr=hw_cis, capsize=5, label=f"Hardware {hw_label}")
+        ax.bar(x + width/2, sw_means, width, yerr=sw_cis, capsize=5, label=f"Software {sw_label}")
+        ax.set_xticks(x)
+        ax.set_xticklabels(ops)
+        ax.set_ylabel("Time")
+        ax.set_title(subtitle)
+        ax.legend()
+        # ax.set_yscale("log")  # keep log scale
+
+    plt.tight_layout(rect=[0, 0, 1, 0.95])
+    output_folder = os.path.join(ROOT, "temp", "plots", platform)
+    os.makedirs(output_folder, exist_ok=True)
+    plt.savefig(os.path.join(output_folder, "time_hw_vs_sw_split.png"), dpi=300, bbox_inches='tight')
+    plt.close()
+
+    print(f"Figure saved for platform: {platform}")
+
+
+if __name__ == "__main__":
+    platform = input("Enter platform (nrf/stm): ").strip().lower()
+    if platform not in PLATFORMS:
+        raise ValueError("Invalid platform. Please enter 'nrf' or 'stm'.")
+    main(platform)
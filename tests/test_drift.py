@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from drift import CHANGE_POINT_ALPHA, analyze_series, change_point, linear_drift
+from traces import TIME_RESOLUTION_S
+
+
+def test_slope_ci_uses_t_quantile():
+    y = np.random.default_rng(0).normal(1.0, 0.1, 10)
+    x = np.arange(10) - 4.5
+    slope, ci, _ = linear_drift(y)
+    residuals = y - y.mean() - slope * x
+    se = np.sqrt((residuals ** 2).sum() / 8 / (x ** 2).sum())
+    assert ci == pytest.approx(2.306 * se, rel=1e-3)
+
+
+def test_trend_and_stable_series():
+    rng = np.random.default_rng(1)
+    y = rng.normal(10, 0.1, 50)
+    assert not analyze_series(y)["drift"]
+    assert analyze_series(y + np.linspace(0, 1, 50))["drift"]
+
+
+def test_change_point_false_positive_rate():
+    # The best of n - 3 splits must not be judged like a single fixed split
+    rng = np.random.default_rng(4)
+    p = np.array([change_point(rng.normal(1.0, 0.15, 10), seed=i)[3] for i in range(400)])
+    assert (p < CHANGE_POINT_ALPHA).mean() < 0.08
+
+
+def test_change_point_detects_step():
+    y = np.r_[np.full(10, 1.0), np.full(10, 1.2)] + np.random.default_rng(5).normal(0, 0.05, 20)
+    k, _, rel_shift, p = change_point(y)
+    assert k == 10 and p < 0.01 and rel_shift == pytest.approx(0.18, abs=0.05)
+
+
+def test_resolution_limited_time_is_not_drift():
+    # sha2-256-rustcrypto on nRF: 7-8 ticks of 20 us, one tick is 13% of the mean
+    y = np.array([7, 7, 7, 7, 7, 8, 8, 8, 8, 8]) * TIME_RESOLUTION_S
+    stats = analyze_series(y, TIME_RESOLUTION_S)
+    assert stats["resolution limited"] and not stats["drift"]
+    assert analyze_series(y)["drift"]
@@ -0,0 +1,41 @@
+import math
+
+import numpy as np
+import pytest
+
+from planner import MIN_ITERATIONS, enough, n_for_ci, n_for_effect
+from results import t_quantile
+
+
+@pytest.mark.parametrize("p, dof, expected", [
+    (0.975, 1, 12.706), (0.975, 2, 4.303), (0.975, 3, 3.182), (0.975, 4, 2.776),
+    (0.975, 5, 2.571), (0.975, 8, 2.306), (0.975, 30, 2.042), (0.975, 1000, 1.962),
+    (0.8, 8, 0.889), (0.8, 30, 0.854),
+])
+def test_t_quantile(p, dof, expected):
+    assert t_quantile(p, dof) == pytest.approx(expected, rel=1e-3)
+
+
+def test_enough_uses_t_quantile_at_min_iterations():
+    # A spread the normal quantile 1.96 would accept, but not t with 4 dof (2.776)
+    values = 1.0 + 0.006 * np.array([-2, -1, 0, 1, 2])
+    assert len(values) == MIN_ITERATIONS
+    assert 1.96 * values.std(ddof=1) / np.sqrt(5) < 0.01
+    assert not enough(values, rel_width=0.01)
+
+
+@pytest.mark.parametrize("cv, rel_width", [(0.02, 0.01), (0.05, 0.05), (0.1, 0.01), (0.003, 0.01)])
+def test_n_for_ci_is_smallest_n_meeting_the_target(cv, rel_width):
+    values = np.random.default_rng(2).normal(1.0, cv, 20)
+    n = n_for_ci(values, rel_width)
+    s, m = values.std(ddof=1), values.mean()
+    width = lambda k: t_quantile(0.975, k - 1) * s / math.sqrt(k)
+    assert width(n) <= rel_width * m
+    assert n == MIN_ITERATIONS or width(n - 1) > rel_width * m
+
+
+def test_n_for_effect_above_normal_approximation():
+    values = np.random.default_rng(3).normal(1.0, 0.02, 20)
+    s = values.std(ddof=1)
+    normal = 2 * ((1.959964 + 0.841621) * s / (0.01 * values.mean())) ** 2
+    assert n_for_effect(values, rel_effect=0.01) > math.ceil(normal)
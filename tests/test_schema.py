@@ -0,0 +1,45 @@
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+import schema
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE = os.path.join(ROOT, "measurements", "nrf", "aes-128-cracen.csv")
+
+
+@pytest.fixture
+def csv(tmp_path):
+    path = tmp_path / "aes-128-cracen.csv"
+    shutil.copy(SAMPLE, path)
+    return str(path)
+
+
+def test_read_fills_cache(csv):
+    df = schema.read(csv)
+    assert os.path.exists(schema.binary_path(csv))
+    pd.testing.assert_frame_equal(schema.read(csv), df)
+    assert [f for f in os.listdir(os.path.dirname(csv)) if f.endswith(".tmp")] == []
+
+
+def test_read_without_cache_writes_nothing(csv):
+    schema.read(csv, cache=False)
+    assert not os.path.exists(schema.binary_path(csv))
+
+
+def test_truncated_cache_falls_back_to_csv(csv):
+    expected = schema.read(csv)
+    npz = schema.binary_path(csv)
+    with open(npz, "r+b") as f:
+        f.truncate(os.path.getsize(npz) // 2)
+    pd.testing.assert_frame_equal(schema.read(csv), expected)
+    # The damaged copy is replaced by a complete one
+    assert schema.read_binary(npz) is not None
+
+
+def test_convert_label():
+    values, label = schema.convert(pd.Series([0.002]), "time (s)", "ms")
+    assert values.iloc[0] == pytest.approx(2.0)
+    assert label == "time (ms)"
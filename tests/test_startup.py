@@ -0,0 +1,31 @@
+import os
+import shutil
+
+import pytest
+
+from cli import HEAVY_MODULES, STARTUP_BUDGET_S, startup_probe
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Wall-clock limit for the test; CI machines are slower and noisier than a
+# developer's, so it defaults to a multiple of the budget `cli.py startup` checks.
+TEST_BUDGET_S = float(os.environ.get("STARTUP_TEST_BUDGET_S", 3 * STARTUP_BUDGET_S))
+
+
+@pytest.fixture(scope="module")
+def probe(tmp_path_factory):
+    # Run on a copy of the CSVs so the .npz copies summary writes stay out of the tree
+    cwd = tmp_path_factory.mktemp("startup")
+    shutil.copytree(os.path.join(ROOT, "measurements"), cwd / "measurements",
+                    ignore=shutil.ignore_patterns("*.npz", "*.npz.tmp"))
+    return startup_probe(runs=3, cwd=str(cwd))
+
+
+def test_summary_imports_no_heavy_modules(probe):
+    _, heavy = probe
+    assert heavy == [], f"summary imported {heavy}; only {HEAVY_MODULES} paths may"
+
+
+def test_summary_startup_budget(probe):
+    best, _ = probe
+    assert best <= TEST_BUDGET_S, f"summary --json took {best:.3f} s (limit {TEST_BUDGET_S} s)"
@@ -0,0 +1,100 @@
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from traces import DELTA_ESCAPE, AnalogTrace, DigitalTrace, decode_deltas, encode_deltas
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GPI_FILES = sorted(glob.glob(os.path.join(ROOT, "raw_measurements", "*", "GPI *.csv")))
+
+#############################################
+# Reference implementations from data_processing.ipynb
+#############################################
+def extract_edges(df):
+    pairs = []
+    start = None
+    for t, v in zip(df["Timestamp"], df["Value"]):
+        if v == 1 and start is None:
+            start = t
+        elif v == 0 and start is not None:
+            pairs.append((start, t))
+            start = None
+    return pairs
+
+
+def range_stats(edge, df2):
+    start, end = edge
+    window = df2[(df2["Timestamp"] >= start) & (df2["Timestamp"] <= end)]
+    return {
+        "max": window["Value"].max(),
+        "avg": window["Value"].mean(),
+        "min": window["Value"].min(),
+    }
+
+
+def analog_frame(t0, dt, n, seed=0):
+    t = np.round(t0 + dt * np.arange(n), 6)
+    values = np.random.default_rng(seed).uniform(0.001, 0.02, n)
+    return pd.DataFrame({"Timestamp": t, "Value": values})
+
+#############################################
+# AnalogTrace
+#############################################
+def test_window_is_inclusive_and_exact():
+    df = analog_frame(0.0, 10e-6, 100)
+    trace = AnalogTrace.from_frame(df)
+    assert trace.index(42e-6, 108e-6) == (5, 11)
+    assert trace.index(50e-6, 100e-6) == (5, 11)
+
+
+@pytest.mark.parametrize("t0", [0.0, 0.3, 1.23457, 3e-6])
+@pytest.mark.parametrize("dt", [10e-6, 20e-6])
+def test_window_stats_match_range_stats(t0, dt):
+    df = analog_frame(t0, dt, 20000)
+    trace = AnalogTrace.from_frame(df)
+    rng = np.random.default_rng(1)
+    # Bounds on the 20 us GPI grid, off the analog grid, and exactly on samples
+    # (rounded to 6 decimals like the exported CSVs)
+    gpi = np.round(np.round(rng.uniform(t0, t0 + dt * 20000, 200) / 20e-6) * 20e-6, 6)
+    samples = rng.choice(df["Timestamp"].to_numpy(), 200)
+    for bounds in [gpi, samples]:
+        for start, end in np.sort(bounds.reshape(-1, 2), axis=1):
+            expected = range_stats((start, end), df)
+            got = trace.window_stats(start, end)
+            if np.isnan(expected["avg"]):
+                assert np.isnan(got["avg"])
+                continue
+            for key in expected:
+                assert got[key] == pytest.approx(expected[key], rel=1e-6)
+
+
+def test_int16_encoding():
+    df = analog_frame(0.0, 10e-6, 10000)
+    trace = AnalogTrace.from_frame(df, encoding="int16")
+    step = (df["Value"].max() - df["Value"].min()) / 65535
+    assert np.abs(trace.values - df["Value"].to_numpy()).max() <= step
+    assert df.memory_usage(deep=True).sum() / trace.nbytes > 7.9
+
+#############################################
+# DigitalTrace
+#############################################
+@pytest.mark.parametrize("path", GPI_FILES, ids=os.path.basename)
+def test_edges_match_notebook(path):
+    df = pd.read_csv(path)
+    trace = DigitalTrace.from_frame(df)
+    expected = np.array(extract_edges(df)).reshape(-1, 2)
+    assert np.allclose(trace.edges(), expected, rtol=0, atol=1e-9)
+    assert (trace.value_at(df["Timestamp"].to_numpy()) == df["Value"].to_numpy()).all()
+    assert df.memory_usage(deep=True).sum() / trace.nbytes >= 7.9
+
+
+def test_delta_coding_long_gaps():
+    ticks = np.array([0, 5, DELTA_ESCAPE - 1, DELTA_ESCAPE * 2 - 1, DELTA_ESCAPE * 5 + 3, 2 ** 40])
+    codes = encode_deltas(ticks)
+    assert codes.dtype == np.uint16
+    assert (decode_deltas(codes) == ticks).all()
+    with pytest.raises(ValueError):
+        encode_deltas([3, 2])
@@ -0,0 +1,226 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+# Sample period of the logic analyser; GPI edges are timestamped on this grid
+TIME_RESOLUTION_S = 20e-6
+
+# uint16 delta that advances the tick count without a transition, so gaps
+# longer than 65534 ticks (1.3 s at 20 us) still fit
+DELTA_ESCAPE = np.iinfo(np.uint16).max
+
+# Tolerance, in samples, between an exported timestamp and the uniform grid
+SNAP = 0.25
+
+# Tolerance, in samples, for float rounding when comparing window bounds to the grid
+EPS = 1e-9
+
+#############################################
+# Uniformly sampled analog channel (current, power)
+#############################################
+class AnalogTrace:
+    """Samples at t0 + i * dt, stored as float32 instead of a (Timestamp, Value) frame.
+
+    With encoding="int16" the values are stored as 16-bit codes of
+    offset + code * scale, a quarter of the float64 column; the quantisation
+    step is (max - min) / 65535 of the capture.
+    """
+
+    def __init__(self, t0, dt, values, encoding="float32"):
+        self.t0 = float(t0)
+        self.dt = float(dt)
+        values = np.asarray(values, dtype=np.float64)
+        if encoding == "float32":
+            self.codes = values.astype(np.float32)
+            self.offset, self.scale = 0.0, 1.0
+        elif encoding == "int16":
+            lo, hi = (values.min(), values.max()) if len(values) else (0.0, 0.0)
+            self.scale = (hi - lo) / 65535 or 1.0
+            self.offset = lo + 32768 * self.scale
+            self.codes = np.round((values - self.offset) / self.scale).astype(np.int16)
+        else:
+            raise ValueError(f"Unknown encoding {encoding!r}. Expected 'float32' or 'int16'.")
+        self.encoding = encoding
+
+    @classmethod
+    def from_frame(cls, df, encoding="float32"):
+        t = df["Timestamp"].to_numpy(dtype=np.float64)
+        n = len(t)
+        if n < 2:
+            raise ValueError("Need at least two samples to infer the sample rate")
+        t0 = t[0]
+        dt = (t[-1] - t0) / (n - 1)
+        # Timestamps are exported with limited precision; anything within
+        # SNAP of the ideal grid maps back to the same index.
+        if np.abs(t - (t0 + dt * np.arange(n))).max() > SNAP * dt:
+            raise ValueError("Timestamps are not uniformly spaced")
+        return cls(t0, dt, df["Value"].to_numpy(), encoding)
+
+    @classmethod
+    def read_csv(cls, path, encoding="float32"):
+        df = pd.read_csv(path, dtype={"Timestamp": np.float64, "Value": np.float64})
+        return cls.from_frame(df, encoding)
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def nbytes(self):
+        return self.codes.nbytes
+
+    @property
+    def values(self):
+        if self.encoding == "float32":
+            return self.codes
+        return (self.offset + self.scale * self.codes.astype(np.float64)).astype(np.float32)
+
+    @property
+    def timestamps(self):
+        return self.t0 + self.dt * np.arange(len(self.codes))
+
+    def index(self, start, end):
+        """Index range of the samples with start <= t <= end."""
+        i0 = max(int(np.ceil((start - self.t0) / self.dt - EPS)), 0)
+        i1 = min(int(np.floor((end - self.t0) / self.dt + EPS)) + 1, len(self.codes))
+        return i0, max(i0, i1)
+
+    def slice(self, start, end):
+        """Trace restricted to start <= t <= end; shares memory with self."""
+        i0, i1 = self.index(start, end)
+        sliced = AnalogTrace.__new__(AnalogTrace)
+        sliced.__dict__.update(self.__dict__)
+        sliced.t0 = self.t0 + i0 * self.dt
+        sliced.codes = self.codes[i0:i1]
+        return sliced
+
+    def window_stats(self, start, end):
+        """Same as range_stats in the notebook: max/avg/min over start <= t <= end."""
+        i0, i1 = self.index(start, end)
+        window = self.codes[i0:i1]
+        if len(window) == 0:
+            return {"max": np.nan, "avg": np.nan, "min": np.nan}
+        # The encoding is monotonic, so decode only the three results
+        return {
+            "max": self.offset + self.scale * float(window.max()),
+            "avg": self.offset + self.scale * float(window.mean(dtype=np.float64)),
+            "min": self.offset + self.scale * float(window.min()),
+        }
+
+#############################################
+# Single-bit channel (GPI), delta-coded transitions
+#############################################
+def encode_deltas(ticks):
+    """uint16 tick deltas between transitions; longer gaps use DELTA_ESCAPE fillers."""
+    ticks = np.asarray(ticks, dtype=np.int64)
+    deltas = np.diff(ticks, prepend=0)
+    if (deltas < 0).any():
+        raise ValueError("Transition ticks must be non-negative and sorted")
+    fillers, rest = np.divmod(deltas, DELTA_ESCAPE)
+    codes = np.full(int((fillers + 1).sum()), DELTA_ESCAPE, dtype=np.uint16)
+    codes[np.cumsum(fillers + 1) - 1] = rest
+    return codes
+
+
+def decode_deltas(codes):
+    """Transition ticks (int64) from encode_deltas output."""
+    return np.cumsum(codes, dtype=np.int64)[codes != DELTA_ESCAPE]
+
+
+class DigitalTrace:
+    """Level flips at start + ticks[i] * dt; before the first flip it is `initial`.
+
+    The logic analyser timestamps every edge on its sample grid, so transitions
+    are kept as uint16 tick deltas (see encode_deltas) and decoded on use.
+    """
+
+    def __init__(self, initial, ticks, start=0.0, dt=TIME_RESOLUTION_S):
+        self.initial = int(initial)
+        self.deltas = encode_deltas(ticks)
+        self.start = float(start)
+        self.dt = float(dt)
+
+    @classmethod
+    def from_frame(cls, df, dt=TIME_RESOLUTION_S):
+        t = df["Timestamp"].to_numpy(dtype=np.float64)
+        v = df["Value"].to_numpy() != 0
+        if len(v) == 0:
+            return cls(0, [], 0.0, dt)
+        ticks = (t - t[0]) / dt
+        rounded = np.round(ticks)
+        if np.abs(ticks - rounded).max() > SNAP:
+            raise ValueError(f"Timestamps are not on a {dt} s sample grid")
+        changed = np.flatnonzero(v[1:] != v[:-1]) + 1
+        return cls(v[0], rounded[changed], t[0], dt)
+
+    @classmethod
+    def read_csv(cls, path, dt=TIME_RESOLUTION_S):
+        return cls.from_frame(pd.read_csv(path), dt)
+
+    @property
+    def nbytes(self):
+        return self.deltas.nbytes
+
+    @property
+    def ticks(self):
+        return decode_deltas(self.deltas)
+
+    @property
+    def transitions(self):
+        return self.start + self.ticks * self.dt
+
+    def value_at(self, t):
+        tick = np.floor((np.asarray(t) - self.start) / self.dt + EPS)
+        flips = np.searchsorted(self.ticks, tick, side="right")
+        return (self.initial + flips) % 2
+
+    def edges(self):
+        """(start, end) pairs of every complete high pulse, as extract_edges in the notebook."""
+        # Transitions alternate; a capture that starts high opens its first
+        # pulse at the start of the capture.
+        ticks = self.ticks
+        if self.initial:
+            ticks = np.concatenate([[0], ticks])
+        starts = ticks[0::2]
+        ends = ticks[1::2]
+        pairs = np.column_stack([starts[:len(ends)], ends])
+        return self.start + pairs * self.dt
+
+    def slice(self, start, end):
+        """Trace restricted to start <= t <= end."""
+        first = int(np.floor((start - self.start) / self.dt + EPS))
+        last = int(np.floor((end - self.start) / self.dt + EPS))
+        ticks = self.ticks
+        i0 = np.searchsorted(ticks, first, side="right")
+        i1 = np.searchsorted(ticks, last, side="right")
+        return DigitalTrace(self.value_at(start), ticks[i0:i1] - first,
+                            self.start + first * self.dt, self.dt)
+
+#############################################
+# Load a raw_measurements/<experiment> folder
+#############################################
+def load_experiment(experiment, folder="raw_measurements", encoding="float32"):
+    """Return {channel: trace} for the channels present in an experiment folder.
+
+    Resident size against the pandas frames: GPI channels 8-9x smaller
+    (uint16 deltas). Analog channels are 4x smaller with the default float32
+    and 8x with encoding="int16", whose step is (max - min) / 65535 of the
+    capture. float32 stays the default because that step has not been checked
+    against the instrument's resolution (the repo has no analog captures to
+    check it on), so analog channels miss the 10x target.
+    """
+    files = {
+        "gpi1": ("GPI 1 - Ace.csv", DigitalTrace),
+        "gpi2": ("GPI 2 - Ace.csv", DigitalTrace),
+        "current": ("Main current - Ace.csv", AnalogTrace),
+        "power": ("Main power - Ace.csv", AnalogTrace),
+    }
+    traces = {}
+    for channel, (name, kind) in files.items():
+        path = os.path.join(folder, experiment, name)
+        if os.path.exists(path):
+            if kind is AnalogTrace:
+                traces[channel] = kind.read_csv(path, encoding)
+            else:
+                traces[channel] = kind.read_csv(path)
+    return traces